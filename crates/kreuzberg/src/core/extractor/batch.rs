@@ -6,6 +6,7 @@
 use crate::core::config::ExtractionConfig;
 use crate::types::{ErrorMetadata, ExtractionResult, Metadata};
 use crate::{KreuzbergError, Result};
+use once_cell::sync::Lazy;
 use std::borrow::Cow;
 use std::path::Path;
 use std::sync::Arc;
@@ -13,12 +14,18 @@ use std::sync::Arc;
 use super::bytes::extract_bytes;
 use super::file::extract_file;
 
+/// Default batch concurrency limit (1.5x the number of CPUs).
+///
+/// `num_cpus::get()` inspects scheduler affinity and cgroup quotas on every call,
+/// so the value is computed once per process rather than once per batch.
+static DEFAULT_MAX_CONCURRENT: Lazy<usize> = Lazy::new(|| (num_cpus::get() as f64 * 1.5).ceil() as usize);
+
 /// Extract content from multiple files concurrently.
 ///
 /// This function processes multiple files in parallel, automatically managing
 /// concurrency to prevent resource exhaustion. The concurrency limit can be
 /// configured via `ExtractionConfig::max_concurrent_extractions` or defaults
-/// to `num_cpus * 2`.
+/// to `num_cpus * 1.5`.
 ///
 /// # Arguments
 ///
@@ -68,9 +75,7 @@ pub async fn batch_extract_file(
 
     let config_arc = Arc::new(config.clone());
 
-    let max_concurrent = config_arc
-        .max_concurrent_extractions
-        .unwrap_or_else(|| (num_cpus::get() as f64 * 1.5).ceil() as usize);
+    let max_concurrent = config_arc.max_concurrent_extractions.unwrap_or(*DEFAULT_MAX_CONCURRENT);
     let semaphore = Arc::new(Semaphore::new(max_concurrent));
 
     let mut tasks = JoinSet::new();
@@ -135,7 +140,7 @@ pub async fn batch_extract_file(
 /// This function processes multiple byte arrays in parallel, automatically managing
 /// concurrency to prevent resource exhaustion. The concurrency limit can be
 /// configured via `ExtractionConfig::max_concurrent_extractions` or defaults
-/// to `num_cpus * 2`.
+/// to `num_cpus * 1.5`.
 ///
 /// # Arguments
 ///
@@ -183,9 +188,7 @@ pub async fn batch_extract_bytes(
 
     let config_arc = Arc::new(config.clone());
 
-    let max_concurrent = config_arc
-        .max_concurrent_extractions
-        .unwrap_or_else(|| (num_cpus::get() as f64 * 1.5).ceil() as usize);
+    let max_concurrent = config_arc.max_concurrent_extractions.unwrap_or(*DEFAULT_MAX_CONCURRENT);
     let semaphore = Arc::new(Semaphore::new(max_concurrent));
 
     let mut tasks = JoinSet::new();
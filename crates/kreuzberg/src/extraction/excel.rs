@@ -51,6 +51,17 @@ use crate::extraction::office_metadata::{
 #[cfg(feature = "office")]
 use serde_json::Value;
 
+/// A sheet read from a workbook, before markdown rendering.
+///
+/// Reading sheets requires `&mut` access to the workbook, so sheets are loaded one after
+/// another; see [`load_and_render_sheets`] for how dense ranges are rendered.
+enum LoadedSheet {
+    /// Sheet that was already fully processed while reading (empty or sparse sheets).
+    Processed(ExcelSheet),
+    /// Dense sheet range that still needs to be rendered.
+    Range(Range<Data>),
+}
+
 pub fn read_excel_file(file_path: &str) -> Result<ExcelWorkbook> {
     let lower_path = file_path.to_lowercase();
 
@@ -150,28 +161,27 @@ fn process_xlsx_workbook<RS: Read + Seek>(
     office_metadata: Option<HashMap<String, String>>,
 ) -> Result<ExcelWorkbook> {
     let sheet_names = workbook.sheet_names();
-    let mut sheets = Vec::with_capacity(sheet_names.len());
 
-    for name in &sheet_names {
-        // Use worksheet_cells_reader to stream cells and detect pathological bounding boxes
-        match process_xlsx_sheet_safe(&mut workbook, name) {
-            Ok(sheet) => sheets.push(sheet),
-            Err(e) => {
-                // Log but don't fail - continue with other sheets
-                tracing::warn!("Failed to process sheet '{}': {}", name, e);
-            }
+    // Use worksheet_cells_reader to stream cells and detect pathological bounding boxes
+    let sheets = load_and_render_sheets(&sheet_names, |name| match load_xlsx_sheet_safe(&mut workbook, name) {
+        Ok(sheet) => Some(sheet),
+        Err(e) => {
+            // Log but don't fail - continue with other sheets
+            tracing::warn!("Failed to process sheet '{}': {}", name, e);
+            None
         }
-    }
+    });
 
     let metadata = extract_metadata(&workbook, &sheet_names, office_metadata);
     Ok(ExcelWorkbook { sheets, metadata })
 }
 
-/// Process a single XLSX sheet safely by pre-checking the bounding box.
+/// Load a single XLSX sheet safely by pre-checking the bounding box.
 ///
 /// This function streams cells to compute the actual bounding box without allocating
 /// a full Range, then only creates the Range if the bounding box is within safe limits.
-fn process_xlsx_sheet_safe<RS: Read + Seek>(workbook: &mut calamine::Xlsx<RS>, sheet_name: &str) -> Result<ExcelSheet> {
+/// Empty and sparse sheets are processed immediately; dense ranges are returned for rendering.
+fn load_xlsx_sheet_safe<RS: Read + Seek>(workbook: &mut calamine::Xlsx<RS>, sheet_name: &str) -> Result<LoadedSheet> {
     // First pass: stream cells to compute actual bounding box and collect cell data
     let (cells, row_min, row_max, col_min, col_max) = {
         let mut cell_reader = workbook
@@ -212,14 +222,14 @@ fn process_xlsx_sheet_safe<RS: Read + Seek>(workbook: &mut calamine::Xlsx<RS>, s
 
     // Check if sheet is empty
     if cells.is_empty() {
-        return Ok(ExcelSheet {
+        return Ok(LoadedSheet::Processed(ExcelSheet {
             name: sheet_name.to_owned(),
             markdown: format!("## {}\n\n*Empty sheet*", sheet_name),
             row_count: 0,
             col_count: 0,
             cell_count: 0,
             table_cells: None,
-        });
+        }));
     }
 
     // Calculate bounding box size
@@ -230,7 +240,8 @@ fn process_xlsx_sheet_safe<RS: Read + Seek>(workbook: &mut calamine::Xlsx<RS>, s
     // Check for pathological bounding box
     if bb_cells > MAX_BOUNDING_BOX_CELLS {
         // Sheet has sparse data at extreme positions - process directly from cells
-        return process_sparse_sheet_from_cells(sheet_name, cells, row_min, row_max, col_min, col_max);
+        return process_sparse_sheet_from_cells(sheet_name, cells, row_min, row_max, col_min, col_max)
+            .map(LoadedSheet::Processed);
     }
 
     // Safe to create a Range - bounding box is within limits
@@ -239,7 +250,54 @@ fn process_xlsx_sheet_safe<RS: Read + Seek>(workbook: &mut calamine::Xlsx<RS>, s
         .worksheet_range(sheet_name)
         .map_err(|e| KreuzbergError::parsing(format!("Failed to parse sheet '{}': {}", sheet_name, e)))?;
 
-    Ok(process_sheet(sheet_name, &range))
+    Ok(LoadedSheet::Range(range))
+}
+
+/// Load sheets in workbook order, rendering each dense range while the next sheet is read.
+///
+/// `load` needs `&mut` access to the workbook, so it runs on the calling thread. The
+/// previous sheet's range is rendered on the rayon pool meanwhile, and each scope waits
+/// for that render before the next sheet is read. At most two dense ranges are alive at
+/// once: the one being rendered and the one just read. While waiting, a caller that is
+/// itself a rayon worker runs queued jobs instead of blocking the pool.
+///
+/// Sheets for which `load` returns `None` are skipped.
+fn load_and_render_sheets<'a>(
+    sheet_names: &'a [String],
+    mut load: impl FnMut(&'a str) -> Option<LoadedSheet>,
+) -> Vec<ExcelSheet> {
+    let span = tracing::Span::current();
+    let mut sheets = Vec::with_capacity(sheet_names.len());
+    let mut pending: Option<(&str, Range<Data>)> = None;
+
+    for name in sheet_names {
+        let previous = pending.take();
+        let mut rendered = None;
+        let loaded = rayon::in_place_scope(|scope| {
+            if let Some((previous_name, range)) = previous {
+                let rendered = &mut rendered;
+                let span = &span;
+                scope.spawn(move |_| {
+                    let _guard = span.enter();
+                    *rendered = Some(process_sheet(previous_name, &range));
+                });
+            }
+            load(name.as_str())
+        });
+
+        sheets.extend(rendered);
+        match loaded {
+            Some(LoadedSheet::Processed(sheet)) => sheets.push(sheet),
+            Some(LoadedSheet::Range(range)) => pending = Some((name.as_str(), range)),
+            None => {}
+        }
+    }
+
+    if let Some((name, range)) = pending {
+        sheets.push(process_sheet(name, &range));
+    }
+
+    sheets
 }
 
 /// Process a sparse sheet directly from collected cells without creating a full Range.
@@ -248,7 +306,7 @@ fn process_xlsx_sheet_safe<RS: Read + Seek>(workbook: &mut calamine::Xlsx<RS>, s
 /// Instead of creating a dense Range, we generate markdown directly from the sparse cells.
 fn process_sparse_sheet_from_cells(
     sheet_name: &str,
-    cells: Vec<((u32, u32), Data)>,
+    mut cells: Vec<((u32, u32), Data)>,
     row_min: u32,
     row_max: u32,
     col_min: u32,
@@ -268,40 +326,32 @@ fn process_sparse_sheet_from_cells(
     )
     .expect("write to String cannot fail");
 
-    // Group cells by row for tabular display
-    let mut cells_by_row: HashMap<u32, Vec<(u32, &Data)>> = HashMap::new();
-    for ((row, col), data) in &cells {
-        cells_by_row.entry(*row).or_default().push((*col, data));
-    }
-
-    // Sort rows and output as simple key-value pairs
-    let mut rows: Vec<_> = cells_by_row.keys().copied().collect();
-    rows.sort_unstable();
+    // Sort cells in row-major order and output as simple key-value pairs.
+    // The cell reader already yields cells (nearly) in this order, so the sort is cheap.
+    cells.sort_unstable_by_key(|&(position, _)| position);
 
     // Limit output to first 1000 cells to avoid huge output
     let mut output_count = 0;
     const MAX_OUTPUT_CELLS: usize = 1000;
+    let mut current_row = None;
 
-    for row in rows {
+    for ((row, col), data) in &cells {
         if output_count >= MAX_OUTPUT_CELLS {
+            // Finish the current row silently, then report what was left out
+            if current_row == Some(*row) {
+                continue;
+            }
             write!(markdown, "\n... ({} more cells not shown)\n", cell_count - output_count)
                 .expect("write to String cannot fail");
             break;
         }
+        current_row = Some(*row);
 
-        let mut row_cells = cells_by_row.remove(&row).unwrap_or_default();
-        row_cells.sort_by_key(|(col, _)| *col);
-
-        for (col, data) in row_cells {
-            if output_count >= MAX_OUTPUT_CELLS {
-                break;
-            }
-            let cell_ref = col_to_excel_letter(col);
-            let cell_str = format_cell_to_string(data);
-            if !cell_str.is_empty() {
-                writeln!(markdown, "- **{}{}**: {}", cell_ref, row + 1, cell_str).expect("write to String cannot fail");
-                output_count += 1;
-            }
+        let cell_ref = col_to_excel_letter(*col);
+        let cell_str = format_cell_to_string(data);
+        if !cell_str.is_empty() {
+            writeln!(markdown, "- **{}{}**: {}", cell_ref, row + 1, cell_str).expect("write to String cannot fail");
+            output_count += 1;
         }
     }
 
@@ -334,14 +384,9 @@ where
 {
     let sheet_names = workbook.sheet_names();
 
-    let mut sheets = Vec::with_capacity(sheet_names.len());
-
-    for name in &sheet_names {
-        if let Ok(range) = workbook.worksheet_range(name) {
-            sheets.push(process_sheet(name, &range));
-        }
-    }
-
+    let sheets = load_and_render_sheets(&sheet_names, |name| {
+        workbook.worksheet_range(name).ok().map(LoadedSheet::Range)
+    });
     let metadata = extract_metadata(&workbook, &sheet_names, office_metadata);
 
     Ok(ExcelWorkbook { sheets, metadata })
@@ -917,6 +962,200 @@ mod tests {
         assert!(lines[4].starts_with("| "));
     }
 
+    #[test]
+    fn test_load_and_render_sheets_preserves_order() {
+        let names: Vec<String> = ["Dense0", "Dense1", "Failed", "Empty", "Dense2", "Dense3"]
+            .iter()
+            .map(|name| name.to_string())
+            .collect();
+
+        let sheets = load_and_render_sheets(&names, |name| match name {
+            "Failed" => None,
+            "Empty" => Some(LoadedSheet::Processed(process_sheet(name, &Range::empty()))),
+            _ => {
+                let mut range: Range<Data> = Range::new((0, 0), (1, 0));
+                range.set_value((0, 0), Data::String("Header".to_owned()));
+                range.set_value((1, 0), Data::String(format!("{}-value", name)));
+                Some(LoadedSheet::Range(range))
+            }
+        });
+
+        let sheet_names: Vec<&str> = sheets.iter().map(|sheet| sheet.name.as_str()).collect();
+        assert_eq!(sheet_names, vec!["Dense0", "Dense1", "Empty", "Dense2", "Dense3"]);
+        assert!(sheets[1].markdown.contains("| Dense1-value |"));
+        assert!(sheets[2].markdown.contains("Empty sheet"));
+        assert!(sheets[4].markdown.contains("| Dense3-value |"));
+    }
+
+    /// Build an in-memory XLSX with one worksheet part per `(name, Some(xml))` entry.
+    /// Entries with `None` are listed in the workbook but have no worksheet part.
+    fn build_xlsx(sheets: &[(&str, Option<String>)]) -> Vec<u8> {
+        use std::io::Write;
+        use zip::write::{FileOptions, ZipWriter};
+
+        let mut workbook_sheets = String::new();
+        let mut relationships = String::new();
+        for (i, (name, _)) in sheets.iter().enumerate() {
+            let id = i + 1;
+            write!(
+                workbook_sheets,
+                r#"<sheet name="{name}" sheetId="{id}" r:id="rId{id}"/>"#
+            )
+            .unwrap();
+            write!(
+                relationships,
+                r#"<Relationship Id="rId{id}" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" Target="worksheets/sheet{id}.xml"/>"#
+            )
+            .unwrap();
+        }
+
+        let mut cursor = Cursor::new(Vec::new());
+        {
+            let mut zip = ZipWriter::new(&mut cursor);
+            let options = FileOptions::<'_, ()>::default();
+
+            zip.start_file("[Content_Types].xml", options).unwrap();
+            zip.write_all(
+                br#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?><Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types"><Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/><Default Extension="xml" ContentType="application/xml"/><Override PartName="/xl/workbook.xml" ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/></Types>"#,
+            )
+            .unwrap();
+
+            zip.start_file("_rels/.rels", options).unwrap();
+            zip.write_all(
+                br#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships"><Relationship Id="rId1" Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" Target="xl/workbook.xml"/></Relationships>"#,
+            )
+            .unwrap();
+
+            zip.start_file("xl/workbook.xml", options).unwrap();
+            write!(
+                zip,
+                r#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?><workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships"><sheets>{workbook_sheets}</sheets></workbook>"#
+            )
+            .unwrap();
+
+            zip.start_file("xl/_rels/workbook.xml.rels", options).unwrap();
+            write!(
+                zip,
+                r#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?><Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">{relationships}</Relationships>"#
+            )
+            .unwrap();
+
+            for (i, (_, xml)) in sheets.iter().enumerate() {
+                if let Some(xml) = xml {
+                    zip.start_file(format!("xl/worksheets/sheet{}.xml", i + 1), options)
+                        .unwrap();
+                    write!(
+                        zip,
+                        r#"<?xml version="1.0" encoding="UTF-8" standalone="yes"?><worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>{xml}</sheetData></worksheet>"#
+                    )
+                    .unwrap();
+                }
+            }
+
+            zip.finish().unwrap();
+        }
+        cursor.into_inner()
+    }
+
+    fn dense_sheet_xml(label: &str, rows: u32) -> String {
+        let mut xml = String::from(
+            r#"<row r="1"><c r="A1" t="inlineStr"><is><t>Name</t></is></c><c r="B1" t="inlineStr"><is><t>Value</t></is></c></row>"#,
+        );
+        for row in 2..=rows + 1 {
+            write!(
+                xml,
+                r#"<row r="{row}"><c r="A{row}" t="inlineStr"><is><t>{label}-{row}</t></is></c><c r="B{row}"><v>{row}</v></c></row>"#
+            )
+            .unwrap();
+        }
+        xml
+    }
+
+    #[test]
+    fn test_read_excel_bytes_matches_sequential_rendering() {
+        let sparse = r#"<row r="1"><c r="A1" t="inlineStr"><is><t>corner</t></is></c></row><row r="1048576"><c r="XFD1048576"><v>42</v></c></row>"#;
+        let bytes = build_xlsx(&[
+            ("First", Some(dense_sheet_xml("first", 20))),
+            ("Second", Some(dense_sheet_xml("second", 5))),
+            ("Missing", None),
+            ("Sparse", Some(sparse.to_owned())),
+            ("Blank", Some(String::new())),
+            ("Third", Some(dense_sheet_xml("third", 50))),
+        ]);
+
+        // Reference: load and render every sheet one after another on this thread
+        let mut workbook = calamine::Xlsx::new(Cursor::new(bytes.as_slice())).unwrap();
+        let mut expected = Vec::new();
+        for name in workbook.sheet_names() {
+            match load_xlsx_sheet_safe(&mut workbook, &name) {
+                Ok(LoadedSheet::Processed(sheet)) => expected.push(sheet),
+                Ok(LoadedSheet::Range(range)) => expected.push(process_sheet(&name, &range)),
+                Err(_) => {}
+            }
+        }
+
+        let result = read_excel_bytes(&bytes, ".xlsx").unwrap();
+
+        let names: Vec<&str> = result.sheets.iter().map(|sheet| sheet.name.as_str()).collect();
+        assert_eq!(names, vec!["First", "Second", "Sparse", "Blank", "Third"]);
+        assert_eq!(result.sheets.len(), expected.len());
+        for (sheet, expected) in result.sheets.iter().zip(&expected) {
+            assert_eq!(sheet.name, expected.name);
+            assert_eq!(sheet.markdown, expected.markdown);
+            assert_eq!(sheet.table_cells, expected.table_cells);
+            assert_eq!(sheet.cell_count, expected.cell_count);
+        }
+        assert!(result.sheets[0].markdown.contains("first-21"));
+        assert!(result.sheets[2].markdown.contains("sparse data"));
+        assert!(result.sheets[2].markdown.contains("- **XFD1048576**: 42"));
+        assert!(result.sheets[3].markdown.contains("Empty sheet"));
+        assert!(result.sheets[4].markdown.contains("third-51"));
+    }
+
+    #[test]
+    fn test_process_sparse_sheet_from_cells_row_major_order() {
+        let cells = vec![
+            ((1_048_575, 0), Data::String("last".to_owned())),
+            ((0, 16_383), Data::Int(2)),
+            ((0, 0), Data::String("first".to_owned())),
+            ((5, 1), Data::Empty),
+            ((5, 0), Data::Bool(true)),
+        ];
+
+        let sheet = process_sparse_sheet_from_cells("Sparse", cells, 0, 1_048_575, 0, 16_383).unwrap();
+
+        let entries: Vec<&str> = sheet.markdown.lines().filter(|line| line.starts_with("- ")).collect();
+        assert_eq!(
+            entries,
+            vec![
+                "- **A1**: first",
+                "- **XFD1**: 2",
+                "- **A6**: true",
+                "- **A1048576**: last"
+            ]
+        );
+        assert_eq!(sheet.cell_count, 5);
+        assert!(sheet.table_cells.is_none());
+    }
+
+    #[test]
+    fn test_process_sparse_sheet_from_cells_truncates_output() {
+        // Seven cells per row, so the 1000-cell limit falls in the middle of row 143
+        let cells: Vec<((u32, u32), Data)> = (0..1200u32)
+            .rev()
+            .map(|i| ((i / 7, i % 7), Data::Int(i as i64)))
+            .collect();
+
+        let sheet = process_sparse_sheet_from_cells("Big", cells, 0, 171, 0, 6).unwrap();
+
+        let entries: Vec<&str> = sheet.markdown.lines().filter(|line| line.starts_with("- ")).collect();
+        assert_eq!(entries.len(), 1000);
+        assert_eq!(entries[0], "- **A1**: 0");
+        assert_eq!(entries[999], "- **F143**: 999");
+        assert!(!sheet.markdown.contains("**G143**"));
+        assert!(sheet.markdown.contains("(200 more cells not shown)"));
+    }
+
     #[test]
     fn test_process_sheet_metadata() {
         let mut range: Range<Data> = Range::new((0, 0), (9, 4));
@@ -5,7 +5,7 @@
 
 use std::collections::HashMap;
 use std::fs::File;
-use std::io::Read;
+use std::io::{Read, Seek};
 use std::path::Path;
 use zip::ZipArchive;
 
@@ -13,17 +13,24 @@ use super::elements::Slide;
 use super::image_handling::get_full_image_path;
 use crate::error::{KreuzbergError, Result};
 
-pub(super) struct PptxContainer {
-    pub(super) archive: ZipArchive<File>,
+pub(super) struct PptxContainer<R: Read + Seek = File> {
+    pub(super) archive: ZipArchive<R>,
     slide_paths: Vec<String>,
 }
 
-impl PptxContainer {
+impl PptxContainer<File> {
     pub(super) fn open<P: AsRef<Path>>(path: P) -> Result<Self> {
         // IO errors must bubble up unchanged - file access issues need user reports ~keep
         let file = File::open(path)?;
 
-        let mut archive = match ZipArchive::new(file) {
+        Self::from_reader(file)
+    }
+}
+
+impl<R: Read + Seek> PptxContainer<R> {
+    /// Open a PPTX archive from any seekable reader, e.g. a `Cursor` over in-memory bytes.
+    pub(super) fn from_reader(reader: R) -> Result<Self> {
+        let mut archive = match ZipArchive::new(reader) {
             Ok(arc) => arc,
             Err(zip::result::ZipError::Io(io_err)) => return Err(io_err.into()), // Bubble up IO errors ~keep
             Err(e) => {
@@ -63,7 +70,7 @@ impl PptxContainer {
         super::image_handling::get_slide_rels_path(slide_path)
     }
 
-    fn find_slide_paths(archive: &mut ZipArchive<File>) -> Result<Vec<String>> {
+    fn find_slide_paths(archive: &mut ZipArchive<R>) -> Result<Vec<String>> {
         if let Ok(rels_data) = Self::read_file_from_archive(archive, "ppt/_rels/presentation.xml.rels")
             && let Ok(paths) = super::parser::parse_presentation_rels(&rels_data)
         {
@@ -84,7 +91,7 @@ impl PptxContainer {
         Ok(slide_paths)
     }
 
-    fn read_file_from_archive(archive: &mut ZipArchive<File>, path: &str) -> Result<Vec<u8>> {
+    fn read_file_from_archive(archive: &mut ZipArchive<R>, path: &str) -> Result<Vec<u8>> {
         let mut file = match archive.by_name(path) {
             Ok(f) => f,
             Err(zip::result::ZipError::Io(io_err)) => return Err(io_err.into()), // Bubble up IO errors ~keep
@@ -102,14 +109,14 @@ impl PptxContainer {
     }
 }
 
-pub(super) struct SlideIterator {
-    container: PptxContainer,
+pub(super) struct SlideIterator<R: Read + Seek = File> {
+    container: PptxContainer<R>,
     current_index: usize,
     total_slides: usize,
 }
 
-impl SlideIterator {
-    pub(super) fn new(container: PptxContainer) -> Self {
+impl<R: Read + Seek> SlideIterator<R> {
+    pub(super) fn new(container: PptxContainer<R>) -> Self {
         let total_slides = container.slide_paths().len();
         Self {
             container,
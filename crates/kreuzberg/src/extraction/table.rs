@@ -55,11 +55,20 @@ pub fn table_from_arrow_to_markdown(arrow_bytes: &[u8]) -> Result<String> {
 }
 
 /// Convert a Polars DataFrame to markdown table format
+///
+/// Cells are formatted column by column so each column is cast and null-checked
+/// once, rather than once per cell; rows are then emitted from the formatted columns.
 fn dataframe_to_markdown(df: &DataFrame) -> Result<String> {
     if df.is_empty() {
         return Ok(String::new());
     }
 
+    let columns = df
+        .get_columns()
+        .iter()
+        .map(|col| format_column_values(col.as_materialized_series()))
+        .collect::<Result<Vec<_>>>()?;
+
     let estimated_capacity = df.height().saturating_mul(df.width()).saturating_mul(12).max(64);
     let mut markdown = String::with_capacity(estimated_capacity);
 
@@ -78,10 +87,8 @@ fn dataframe_to_markdown(df: &DataFrame) -> Result<String> {
 
     for row_idx in 0..df.height() {
         markdown.push_str("| ");
-        for col in df.get_columns() {
-            let series = col.as_materialized_series();
-            let value = format_cell_value(series, row_idx)?;
-            markdown.push_str(&value);
+        for values in &columns {
+            markdown.push_str(&values[row_idx]);
             markdown.push_str(" | ");
         }
         markdown.push('\n');
@@ -90,13 +97,9 @@ fn dataframe_to_markdown(df: &DataFrame) -> Result<String> {
     Ok(markdown)
 }
 
-fn format_cell_value(series: &Series, idx: usize) -> Result<String> {
-    let is_null_array = series.is_null();
-    if is_null_array.get(idx).unwrap_or(false) {
-        return Ok(String::new());
-    }
-
-    let value_str = match series.dtype() {
+/// Format every value of a column, yielding an empty string for nulls.
+fn format_column_values(series: &Series) -> Result<Vec<String>> {
+    let values: Vec<String> = match series.dtype() {
         DataType::Int8 | DataType::Int16 | DataType::Int32 | DataType::Int64 => {
             let casted = series
                 .cast(&DataType::Int64)
@@ -104,9 +107,9 @@ fn format_cell_value(series: &Series, idx: usize) -> Result<String> {
             casted
                 .i64()
                 .map_err(|e| KreuzbergError::parsing(format!("Failed to get i64 value: {}", e)))?
-                .get(idx)
-                .map(|v| v.to_string())
-                .unwrap_or_default()
+                .into_iter()
+                .map(|v| v.map(|v| v.to_string()).unwrap_or_default())
+                .collect()
         }
         DataType::UInt8 | DataType::UInt16 | DataType::UInt32 | DataType::UInt64 => {
             let casted = series
@@ -115,9 +118,9 @@ fn format_cell_value(series: &Series, idx: usize) -> Result<String> {
             casted
                 .u64()
                 .map_err(|e| KreuzbergError::parsing(format!("Failed to get u64 value: {}", e)))?
-                .get(idx)
-                .map(|v| v.to_string())
-                .unwrap_or_default()
+                .into_iter()
+                .map(|v| v.map(|v| v.to_string()).unwrap_or_default())
+                .collect()
         }
         DataType::Float32 | DataType::Float64 => {
             let casted = series
@@ -126,28 +129,37 @@ fn format_cell_value(series: &Series, idx: usize) -> Result<String> {
             casted
                 .f64()
                 .map_err(|e| KreuzbergError::parsing(format!("Failed to get f64 value: {}", e)))?
-                .get(idx)
-                .map(|v| format!("{:.2}", v))
-                .unwrap_or_default()
+                .into_iter()
+                .map(|v| v.map(|v| format!("{:.2}", v)).unwrap_or_default())
+                .collect()
         }
         DataType::Boolean => series
             .bool()
             .map_err(|e| KreuzbergError::parsing(format!("Failed to get bool value: {}", e)))?
-            .get(idx)
-            .map(|v| v.to_string())
-            .unwrap_or_default(),
+            .into_iter()
+            .map(|v| v.map(|v| v.to_string()).unwrap_or_default())
+            .collect(),
         DataType::String => series
             .str()
             .map_err(|e| KreuzbergError::parsing(format!("Failed to get string value: {}", e)))?
-            .get(idx)
-            .map(|v| v.to_string())
-            .unwrap_or_default(),
+            .into_iter()
+            .map(|v| v.map(|v| v.to_string()).unwrap_or_default())
+            .collect(),
         _ => {
-            format!("{:?}", series.get(idx))
+            let is_null = series.is_null();
+            (0..series.len())
+                .map(|idx| {
+                    if is_null.get(idx).unwrap_or(false) {
+                        String::new()
+                    } else {
+                        format!("{:?}", series.get(idx))
+                    }
+                })
+                .collect()
         }
     };
 
-    Ok(value_str)
+    Ok(values)
 }
 
 #[cfg(test)]
@@ -218,6 +230,19 @@ mod tests {
         assert!(markdown.contains("| Charlie | 3 |"));
     }
 
+    #[test]
+    fn test_dataframe_with_nulls_in_every_column_type() {
+        let s1 = Series::new("name".into(), &[Some("Alice"), None]);
+        let s2 = Series::new("score".into(), &[None, Some(2.5)]);
+        let s3 = Series::new("active".into(), &[Some(true), None]);
+        let df = DataFrame::new(vec![s1.into(), s2.into(), s3.into()]).unwrap();
+
+        let markdown = dataframe_to_markdown(&df).unwrap();
+
+        assert!(markdown.contains("| Alice |  | true |"));
+        assert!(markdown.contains("|  | 2.50 |  |"));
+    }
+
     #[test]
     fn test_dataframe_with_booleans() {
         let df = df!(
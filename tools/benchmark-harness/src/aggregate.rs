@@ -7,6 +7,7 @@
 //!
 //! Calculates percentile-based statistics for better understanding of performance distributions.
 
+use crate::stats::{push_finite, sort_samples};
 use crate::types::{BenchmarkResult, DiskSizeInfo};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
@@ -197,23 +198,24 @@ pub fn aggregate_new_format(results: &[BenchmarkResult]) -> NewConsolidatedResul
         };
     }
 
-    let mut by_framework_mode: HashMap<String, HashMap<String, Vec<&BenchmarkResult>>> = HashMap::new();
+    // Group on borrowed (framework, mode) and file type keys; owned strings are only
+    // allocated once per group below
+    let mut by_framework_mode: HashMap<(&str, &str), HashMap<&str, Vec<&BenchmarkResult>>> = HashMap::new();
     let mut disk_sizes: HashMap<String, DiskSizeInfo> = HashMap::new();
     let mut file_types = std::collections::HashSet::new();
 
     // Group results by framework:mode and file type
     for result in results {
         let (framework, mode) = extract_framework_and_mode(&result.framework);
-        let key = format!("{}:{}", framework, mode);
 
         by_framework_mode
-            .entry(key)
+            .entry((framework, mode))
             .or_default()
-            .entry(result.file_extension.clone())
+            .entry(result.file_extension.as_str())
             .or_default()
             .push(result);
 
-        file_types.insert(result.file_extension.clone());
+        file_types.insert(result.file_extension.as_str());
 
         // Collect disk sizes
         if let Some(disk_size) = &result.framework_capabilities.installation_size {
@@ -224,10 +226,8 @@ pub fn aggregate_new_format(results: &[BenchmarkResult]) -> NewConsolidatedResul
     // Aggregate each framework:mode combination
     let mut aggregated_by_framework_mode = HashMap::new();
 
-    for (framework_mode_key, file_type_results) in by_framework_mode {
-        let parts: Vec<&str> = framework_mode_key.split(':').collect();
-        let framework = parts[0].to_string();
-        let mode = parts[1].to_string();
+    for ((framework, mode), file_type_results) in by_framework_mode {
+        let framework_mode_key = format!("{}:{}", framework, mode);
 
         // Collect all results for this framework:mode for cold start calculation
         let all_results: Vec<&BenchmarkResult> = file_type_results.values().flat_map(|v| v.iter().copied()).collect();
@@ -238,9 +238,9 @@ pub fn aggregate_new_format(results: &[BenchmarkResult]) -> NewConsolidatedResul
         for (file_type, results_for_type) in file_type_results {
             let aggregation = aggregate_by_ocr_status(&results_for_type);
             by_file_type.insert(
-                file_type.clone(),
+                file_type.to_string(),
                 FileTypeAggregation {
-                    file_type: file_type.clone(),
+                    file_type: file_type.to_string(),
                     no_ocr: aggregation.0,
                     with_ocr: aggregation.1,
                 },
@@ -248,10 +248,10 @@ pub fn aggregate_new_format(results: &[BenchmarkResult]) -> NewConsolidatedResul
         }
 
         aggregated_by_framework_mode.insert(
-            framework_mode_key.clone(),
+            framework_mode_key,
             FrameworkModeAggregation {
-                framework,
-                mode,
+                framework: framework.to_string(),
+                mode: mode.to_string(),
                 cold_start,
                 by_file_type,
             },
@@ -288,17 +288,8 @@ fn aggregate_by_ocr_status(
     // - OcrStatus::Used → "with_ocr" group
     // - OcrStatus::NotUsed → "no_ocr" group
     // - OcrStatus::Unknown → "no_ocr" group (fallback; unknown is conservatively treated as non-OCR)
-    let no_ocr: Vec<&BenchmarkResult> = results
-        .iter()
-        .filter(|r| r.ocr_status != OcrStatus::Used)
-        .copied()
-        .collect();
-
-    let with_ocr: Vec<&BenchmarkResult> = results
-        .iter()
-        .filter(|r| r.ocr_status == OcrStatus::Used)
-        .copied()
-        .collect();
+    let (with_ocr, no_ocr): (Vec<&BenchmarkResult>, Vec<&BenchmarkResult>) =
+        results.iter().partition(|r| r.ocr_status == OcrStatus::Used);
 
     let no_ocr_stats = if !no_ocr.is_empty() {
         Some(calculate_percentiles(&no_ocr))
@@ -320,38 +311,38 @@ fn aggregate_by_ocr_status(
 /// Only uses successful results for metric calculations.
 /// Success rate is calculated from all results.
 fn calculate_percentiles(results: &[&BenchmarkResult]) -> PerformancePercentiles {
-    let successful: Vec<&BenchmarkResult> = results.iter().filter(|r| r.success).copied().collect();
-
-    // Extract values for percentile calculation with NaN filtering - HIGH PRIORITY FIX
-    let mut durations: Vec<f64> = successful
-        .iter()
-        .map(|r| r.duration.as_secs_f64() * 1000.0)
-        .filter(|&v| !v.is_nan() && v.is_finite())
-        .collect();
-
-    let mut throughputs: Vec<f64> = successful
-        .iter()
-        .map(|r| r.metrics.throughput_bytes_per_sec / 1_000_000.0) // Convert to MB/s
-        .filter(|&v| !v.is_nan() && v.is_finite())
-        .collect();
-
-    let mut memories: Vec<f64> = successful
-        .iter()
-        .map(|r| r.metrics.peak_memory_bytes as f64 / 1_000_000.0) // Convert to MB
-        .filter(|&v| !v.is_nan() && v.is_finite())
-        .collect();
-
-    let mut extraction_durations: Vec<f64> = successful
-        .iter()
-        .filter_map(|r| r.extraction_duration.map(|d| d.as_secs_f64() * 1000.0))
-        .filter(|&v| !v.is_nan() && v.is_finite())
-        .collect();
+    // Filter successful results and extract every metric in a single pass,
+    // dropping NaN/Inf values - HIGH PRIORITY FIX
+    let mut successful_count = 0;
+    let mut durations: Vec<f64> = Vec::with_capacity(results.len());
+    let mut throughputs: Vec<f64> = Vec::with_capacity(results.len());
+    let mut memories: Vec<f64> = Vec::with_capacity(results.len());
+    let mut extraction_durations: Vec<f64> = Vec::new();
+    let mut f1_texts: Vec<f64> = Vec::new();
+    let mut f1_numerics: Vec<f64> = Vec::new();
+    let mut quality_scores: Vec<f64> = Vec::new();
+
+    for result in results.iter().filter(|r| r.success) {
+        successful_count += 1;
+
+        push_finite(&mut durations, result.duration.as_secs_f64() * 1000.0);
+        push_finite(&mut throughputs, result.metrics.throughput_bytes_per_sec / 1_000_000.0); // Convert to MB/s
+        push_finite(&mut memories, result.metrics.peak_memory_bytes as f64 / 1_000_000.0); // Convert to MB
+        if let Some(extraction_duration) = result.extraction_duration {
+            push_finite(&mut extraction_durations, extraction_duration.as_secs_f64() * 1000.0);
+        }
+        if let Some(quality) = &result.quality {
+            push_finite(&mut f1_texts, quality.f1_score_text);
+            push_finite(&mut f1_numerics, quality.f1_score_numeric);
+            push_finite(&mut quality_scores, quality.quality_score);
+        }
+    }
 
-    // Sort for percentile calculation (NaN-safe)
-    durations.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-    throughputs.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-    memories.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-    extraction_durations.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    // Sort each metric once; p50/p95/p99 are then read from the same sorted slice
+    sort_samples(&mut durations);
+    sort_samples(&mut throughputs);
+    sort_samples(&mut memories);
+    sort_samples(&mut extraction_durations);
 
     // Build percentiles with NaN/Inf validation
     let duration = Percentiles {
@@ -383,46 +374,28 @@ fn calculate_percentiles(results: &[&BenchmarkResult]) -> PerformancePercentiles
     };
 
     let success_rate_percent = if !results.is_empty() {
-        (successful.len() as f64 / results.len() as f64) * 100.0
+        (successful_count as f64 / results.len() as f64) * 100.0
     } else {
         0.0
     };
 
     // Quality percentiles
-    let quality = {
-        let mut f1_texts: Vec<f64> = successful
-            .iter()
-            .filter_map(|r| r.quality.as_ref().map(|q| q.f1_score_text))
-            .filter(|v| !v.is_nan() && v.is_finite())
-            .collect();
-        let mut f1_numerics: Vec<f64> = successful
-            .iter()
-            .filter_map(|r| r.quality.as_ref().map(|q| q.f1_score_numeric))
-            .filter(|v| !v.is_nan() && v.is_finite())
-            .collect();
-        let mut quality_scores: Vec<f64> = successful
-            .iter()
-            .filter_map(|r| r.quality.as_ref().map(|q| q.quality_score))
-            .filter(|v| !v.is_nan() && v.is_finite())
-            .collect();
-
-        if !quality_scores.is_empty() {
-            f1_texts.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-            f1_numerics.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-            quality_scores.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
-
-            Some(QualityPercentiles {
-                f1_text_p50: sanitize_f64(calculate_percentile_value(&f1_texts, 0.50)),
-                f1_numeric_p50: sanitize_f64(calculate_percentile_value(&f1_numerics, 0.50)),
-                quality_score_p50: sanitize_f64(calculate_percentile_value(&quality_scores, 0.50)),
-            })
-        } else {
-            None
-        }
+    let quality = if !quality_scores.is_empty() {
+        sort_samples(&mut f1_texts);
+        sort_samples(&mut f1_numerics);
+        sort_samples(&mut quality_scores);
+
+        Some(QualityPercentiles {
+            f1_text_p50: sanitize_f64(calculate_percentile_value(&f1_texts, 0.50)),
+            f1_numeric_p50: sanitize_f64(calculate_percentile_value(&f1_numerics, 0.50)),
+            quality_score_p50: sanitize_f64(calculate_percentile_value(&quality_scores, 0.50)),
+        })
+    } else {
+        None
     };
 
     PerformancePercentiles {
-        successful_sample_count: successful.len(), // CRITICAL FIX: Count only successful results used for percentiles
+        successful_sample_count: successful_count, // CRITICAL FIX: Count only successful results used for percentiles
         total_sample_count: results.len(),
         throughput,
         memory,
@@ -437,21 +410,20 @@ fn calculate_percentiles(results: &[&BenchmarkResult]) -> PerformancePercentiles
 ///
 /// Returns percentiles of cold start durations if any results have cold start data.
 fn aggregate_cold_starts(results: &[&BenchmarkResult]) -> Option<DurationPercentiles> {
-    let cold_starts: Vec<f64> = results
+    let mut sorted: Vec<f64> = results
         .iter()
         .filter_map(|r| r.cold_start_duration.map(|d| d.as_secs_f64() * 1000.0))
-        .filter(|&v| !v.is_nan() && v.is_finite()) // HIGH PRIORITY FIX: NaN filtering
+        .filter(|v| v.is_finite()) // HIGH PRIORITY FIX: NaN filtering
         .collect();
 
-    if cold_starts.is_empty() {
+    if sorted.is_empty() {
         return None;
     }
 
-    let mut sorted = cold_starts.clone();
-    sorted.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    sort_samples(&mut sorted);
 
     Some(DurationPercentiles {
-        sample_count: cold_starts.len(),
+        sample_count: sorted.len(),
         p50_ms: sanitize_f64(calculate_percentile_value(&sorted, 0.50)),
         p95_ms: sanitize_f64(calculate_percentile_value(&sorted, 0.95)),
         p99_ms: sanitize_f64(calculate_percentile_value(&sorted, 0.99)),
@@ -533,6 +505,10 @@ fn build_comparison(by_framework_mode: &HashMap<String, FrameworkModeAggregation
         ));
     }
 
+    // Order by key so the stable sorts below break ties by framework:mode and the
+    // baseline choice does not depend on hash map iteration order
+    metrics.sort_by(|a, b| a.0.cmp(&b.0));
+
     // Performance ranking (lower duration = better, rank 1)
     let mut perf = metrics.clone();
     perf.retain(|m| m.1.is_finite()); // Filter out NaN quality scores
@@ -807,6 +783,40 @@ mod tests {
         assert!(percentiles.memory.p50 > 0.0);
     }
 
+    #[test]
+    fn test_calculate_percentiles_quality_from_successful_results() {
+        use crate::types::QualityMetrics;
+
+        let quality = |score: f64| {
+            Some(QualityMetrics {
+                f1_score_text: score,
+                f1_score_numeric: score / 2.0,
+                f1_score_layout: 0.0,
+                quality_score: score,
+            })
+        };
+
+        let mut r1 = create_test_result("kreuzberg-rust", "pdf", OcrStatus::NotUsed, 100, 1_000_000.0, 1_000_000);
+        r1.quality = quality(0.2);
+        let mut r2 = create_test_result("kreuzberg-rust", "pdf", OcrStatus::NotUsed, 200, 1_000_000.0, 1_000_000);
+        r2.quality = quality(0.6);
+        let mut r3 = create_test_result("kreuzberg-rust", "pdf", OcrStatus::NotUsed, 300, 1_000_000.0, 1_000_000);
+        r3.quality = quality(f64::NAN);
+        let mut failed = create_test_result("kreuzberg-rust", "pdf", OcrStatus::NotUsed, 400, 1_000_000.0, 1_000_000);
+        failed.success = false;
+        failed.quality = quality(1.0);
+
+        let results = vec![&r1, &r2, &r3, &failed];
+        let stats = calculate_percentiles(&results);
+
+        assert_eq!(stats.successful_sample_count, 3);
+        assert_eq!(stats.total_sample_count, 4);
+        let quality = stats.quality.expect("quality percentiles");
+        assert!((quality.quality_score_p50 - 0.4).abs() < 1e-9);
+        assert!((quality.f1_text_p50 - 0.4).abs() < 1e-9);
+        assert!((quality.f1_numeric_p50 - 0.2).abs() < 1e-9);
+    }
+
     #[test]
     fn test_aggregate_cold_starts() {
         let results = [
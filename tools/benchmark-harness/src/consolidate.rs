@@ -1,10 +1,10 @@
 //! Aggregation and analysis functions for consolidating multiple benchmark runs
 
-use crate::stats::percentile_r7;
+use crate::stats::{percentile_r7, sort_samples};
 use crate::types::{BenchmarkResult, QualityMetrics};
 use crate::{Error, Result};
 use serde::{Deserialize, Serialize};
-use std::collections::HashMap;
+use std::collections::{BTreeMap, HashMap};
 use std::fs;
 use std::path::Path;
 
@@ -59,7 +59,7 @@ pub struct CrossFrameworkComparison {
     pub throughput_ranking: Vec<FrameworkRanking>,
     pub memory_ranking: Vec<FrameworkRanking>,
     pub reliability_ranking: Vec<FrameworkRanking>,
-    pub deltas_vs_baseline: HashMap<String, PerformanceDelta>,
+    pub deltas_vs_baseline: BTreeMap<String, PerformanceDelta>,
 }
 
 /// Framework ranking entry
@@ -141,8 +141,10 @@ pub fn load_run_results(dir: &Path) -> Result<Vec<BenchmarkResult>> {
 
         if path.is_file() && path.file_name().is_some_and(|n| n == "results.json") {
             eprintln!("Loading results from {}", path.display());
-            let json_content = fs::read_to_string(&path).map_err(Error::Io)?;
-            let run_results: Vec<BenchmarkResult> = serde_json::from_str(&json_content)
+            // Parse the raw bytes directly: from_slice is faster than from_reader and skips the
+            // separate UTF-8 validation pass that reading into a String would add.
+            let bytes = fs::read(&path).map_err(Error::Io)?;
+            let run_results: Vec<BenchmarkResult> = serde_json::from_slice(&bytes)
                 .map_err(|e| Error::Benchmark(format!("Failed to parse {}: {}", path.display(), e)))?;
 
             // Validate loaded results
@@ -169,25 +171,26 @@ pub fn consolidate_runs(runs: Vec<Vec<BenchmarkResult>>) -> Result<ConsolidatedR
     }
 
     eprintln!("Consolidating {} runs", runs.len());
-    let all_results: Vec<&BenchmarkResult> = runs.iter().flat_map(|r| r.iter()).collect();
+    let total_files: usize = runs.iter().map(Vec::len).sum();
 
-    if all_results.is_empty() {
+    if total_files == 0 {
         return Err(Error::Benchmark("No benchmark results to consolidate".to_string()));
     }
 
-    let total_files = all_results.len();
-    let all_results_owned: Vec<BenchmarkResult> = runs.iter().flat_map(|r| r.iter().cloned()).collect();
-
     eprintln!("Aggregating results by framework");
     let by_framework = aggregate_by_framework_with_runs(&runs)?;
 
+    let run_count = runs.len();
+    // Group straight from the per-run lists instead of concatenating them first; the
+    // comparison and quality passes share the same framework partitioning.
+    let groups = group_by_framework(runs.iter().flatten());
+
     eprintln!("Comparing frameworks");
-    let comparison = compare_frameworks(&all_results_owned);
+    let comparison = compare_framework_groups(&groups);
 
     eprintln!("Analyzing quality metrics");
-    let quality = analyze_quality(&all_results_owned);
+    let quality = analyze_quality_groups(&groups);
 
-    let run_count = runs.len();
     let framework_count = by_framework.len();
 
     Ok(ConsolidatedResults {
@@ -202,17 +205,39 @@ pub fn consolidate_runs(runs: Vec<Vec<BenchmarkResult>>) -> Result<ConsolidatedR
 
 /// Aggregate results by framework
 pub fn aggregate_by_framework(results: &[BenchmarkResult]) -> HashMap<String, FrameworkAggregation> {
-    let mut by_framework: HashMap<String, Vec<&BenchmarkResult>> = HashMap::new();
+    aggregate_framework_groups(&group_by_framework(results))
+        .into_iter()
+        .collect()
+}
+
+/// Partition results by framework name, borrowing both keys and results
+///
+/// Groups are kept in name order, so the comparison rankings, baseline deltas and
+/// quality framework lists built from them are deterministic, with ranking ties broken
+/// by framework name. Accepts any iterator of borrowed results, so results spread
+/// across several runs can be grouped without merging them.
+fn group_by_framework<'a>(
+    results: impl IntoIterator<Item = &'a BenchmarkResult>,
+) -> BTreeMap<&'a str, Vec<&'a BenchmarkResult>> {
+    let mut by_framework: BTreeMap<&str, Vec<&BenchmarkResult>> = BTreeMap::new();
     for result in results {
-        by_framework.entry(result.framework.clone()).or_default().push(result);
+        by_framework.entry(result.framework.as_str()).or_default().push(result);
     }
+    by_framework
+}
 
-    let mut aggregations = HashMap::new();
-    for (framework, framework_results) in by_framework {
-        let agg = create_framework_aggregation(&framework, &framework_results);
-        aggregations.insert(framework, agg);
-    }
-    aggregations
+fn aggregate_framework_groups(
+    groups: &BTreeMap<&str, Vec<&BenchmarkResult>>,
+) -> BTreeMap<String, FrameworkAggregation> {
+    groups
+        .iter()
+        .map(|(framework, framework_results)| {
+            (
+                framework.to_string(),
+                create_framework_aggregation(framework, framework_results),
+            )
+        })
+        .collect()
 }
 
 fn aggregate_by_framework_with_runs(runs: &[Vec<BenchmarkResult>]) -> Result<HashMap<String, FrameworkAggregation>> {
@@ -410,7 +435,12 @@ fn create_framework_aggregation(framework: &str, results: &[&BenchmarkResult]) -
 
 /// Compare frameworks with cross-framework analysis
 pub fn compare_frameworks(results: &[BenchmarkResult]) -> CrossFrameworkComparison {
-    let aggregations = aggregate_by_framework(results);
+    compare_framework_groups(&group_by_framework(results))
+}
+
+fn compare_framework_groups(groups: &BTreeMap<&str, Vec<&BenchmarkResult>>) -> CrossFrameworkComparison {
+    // Aggregations are in framework name order, so the stable sorts below break ties by name
+    let aggregations = aggregate_framework_groups(groups);
 
     let mut performance_ranking: Vec<_> = aggregations
         .values()
@@ -501,7 +531,7 @@ pub fn compare_frameworks(results: &[BenchmarkResult]) -> CrossFrameworkComparis
     let baseline_framework = performance_ranking.first().map(|r| r.framework.as_str());
     let baseline_agg = baseline_framework.and_then(|f| aggregations.get(f));
 
-    let mut deltas_vs_baseline = HashMap::new();
+    let mut deltas_vs_baseline = BTreeMap::new();
     if let Some(baseline) = baseline_agg {
         for (framework, agg) in &aggregations {
             if framework != &baseline.framework {
@@ -553,16 +583,15 @@ pub fn compare_frameworks(results: &[BenchmarkResult]) -> CrossFrameworkComparis
 
 /// Analyze quality metrics across frameworks
 pub fn analyze_quality(results: &[BenchmarkResult]) -> QualityAnalysis {
-    let mut by_framework: HashMap<String, Vec<&BenchmarkResult>> = HashMap::new();
-
-    for result in results {
-        by_framework.entry(result.framework.clone()).or_default().push(result);
-    }
+    analyze_quality_groups(&group_by_framework(results))
+}
 
+fn analyze_quality_groups(groups: &BTreeMap<&str, Vec<&BenchmarkResult>>) -> QualityAnalysis {
     let mut by_framework_quality = HashMap::new();
     let mut quality_ranking_data = Vec::new();
+    let mut quality_degradation_concerns = Vec::new();
 
-    for (framework, framework_results) in by_framework {
+    for (&framework, framework_results) in groups {
         let with_metrics: Vec<_> = framework_results
             .iter()
             .filter(|r| r.quality.is_some())
@@ -607,7 +636,7 @@ pub fn analyze_quality(results: &[BenchmarkResult]) -> QualityAnalysis {
             let (_, _, f1_text_std_dev) = calculate_variance(&f1_texts);
 
             let framework_quality = FrameworkQuality {
-                framework: framework.clone(),
+                framework: framework.to_string(),
                 files_with_metrics: with_metrics.len(),
                 mean_f1_text,
                 f1_text_std_dev,
@@ -617,8 +646,11 @@ pub fn analyze_quality(results: &[BenchmarkResult]) -> QualityAnalysis {
                 quality_score_std_dev: quality_std_dev,
             };
 
-            quality_ranking_data.push((framework.clone(), mean_quality, quality_std_dev));
-            by_framework_quality.insert(framework, framework_quality);
+            quality_ranking_data.push((framework.to_string(), mean_quality, quality_std_dev));
+            if quality_std_dev > 0.2 {
+                quality_degradation_concerns.push(framework.to_string());
+            }
+            by_framework_quality.insert(framework.to_string(), framework_quality);
         }
     }
 
@@ -636,7 +668,7 @@ pub fn analyze_quality(results: &[BenchmarkResult]) -> QualityAnalysis {
         .collect();
 
     let mut by_file: HashMap<String, Vec<bool>> = HashMap::new();
-    for result in results {
+    for result in groups.values().flatten() {
         let file_key = result.file_path.to_string_lossy().to_string();
         by_file.entry(file_key).or_default().push(result.success);
     }
@@ -652,25 +684,10 @@ pub fn analyze_quality(results: &[BenchmarkResult]) -> QualityAnalysis {
         0.0
     };
 
-    let mut framework_results: HashMap<String, (usize, usize)> = HashMap::new();
-    for result in results {
-        let (success_count, total_count) = framework_results.entry(result.framework.clone()).or_insert((0, 0));
-        *total_count += 1;
-        if result.success {
-            *success_count += 1;
-        }
-    }
-
-    let perfect_frameworks: Vec<String> = framework_results
-        .into_iter()
-        .filter(|(_, (success, total))| success == total && total > &0)
-        .map(|(f, _)| f)
-        .collect();
-
-    let quality_degradation_concerns = by_framework_quality
-        .values()
-        .filter(|q| q.quality_score_std_dev > 0.2)
-        .map(|q| q.framework.clone())
+    let perfect_frameworks: Vec<String> = groups
+        .iter()
+        .filter(|(_, framework_results)| !framework_results.is_empty() && framework_results.iter().all(|r| r.success))
+        .map(|(framework, _)| framework.to_string())
         .collect();
 
     let reliability = QualityReliability {
@@ -688,15 +705,7 @@ pub fn analyze_quality(results: &[BenchmarkResult]) -> QualityAnalysis {
 
 /// Write consolidated results to JSON
 pub fn write_consolidated_json(results: &ConsolidatedResults, path: &Path) -> Result<()> {
-    if let Some(parent) = path.parent() {
-        fs::create_dir_all(parent).map_err(Error::Io)?;
-    }
-
-    let json = serde_json::to_string_pretty(results)
-        .map_err(|e| Error::Benchmark(format!("Failed to serialize results: {}", e)))?;
-
-    fs::write(path, json).map_err(Error::Io)?;
-    Ok(())
+    crate::output::write_pretty_json(results, path, "results")
 }
 
 fn calculate_variance(values: &[f64]) -> (f64, f64, f64) {
@@ -745,12 +754,8 @@ fn calculate_extension_stats(results: &[&BenchmarkResult]) -> HashMap<String, Ex
         let durations: Vec<f64> = ext_results.iter().map(|r| r.duration.as_secs_f64() * 1000.0).collect();
 
         let (mean_duration, _, _) = calculate_variance(&durations);
-        let mut filtered_durations: Vec<f64> = durations
-            .iter()
-            .copied()
-            .filter(|v| !v.is_nan() && v.is_finite())
-            .collect();
-        filtered_durations.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+        let mut filtered_durations: Vec<f64> = durations.iter().copied().filter(|v| v.is_finite()).collect();
+        sort_samples(&mut filtered_durations);
         let p95_duration = percentile_r7(&filtered_durations, 0.95);
 
         let mean_throughput = if !successful.is_empty() {
@@ -1032,4 +1037,75 @@ mod tests {
         assert_eq!(comparison.performance_ranking[0].framework, "Framework A");
         assert_eq!(comparison.performance_ranking[0].rank, 1);
     }
+
+    #[test]
+    fn test_compare_frameworks_breaks_ties_by_name() {
+        // Zeta and Alpha tie on mean duration; input order is deliberately not name order
+        let results = vec![
+            create_test_result("Zeta", "file1.pdf", true, 100),
+            create_test_result("Mid", "file1.pdf", true, 200),
+            create_test_result("Alpha", "file1.pdf", true, 100),
+        ];
+        let comparison = compare_frameworks(&results);
+
+        let performance: Vec<&str> = comparison
+            .performance_ranking
+            .iter()
+            .map(|r| r.framework.as_str())
+            .collect();
+        assert_eq!(performance, vec!["Alpha", "Zeta", "Mid"]);
+
+        // Every framework has the same throughput, so the ranking is pure name order
+        let throughput: Vec<&str> = comparison
+            .throughput_ranking
+            .iter()
+            .map(|r| r.framework.as_str())
+            .collect();
+        assert_eq!(throughput, vec!["Alpha", "Mid", "Zeta"]);
+
+        let delta_keys: Vec<&str> = comparison.deltas_vs_baseline.keys().map(String::as_str).collect();
+        assert_eq!(delta_keys, vec!["Mid", "Zeta"]);
+    }
+
+    #[test]
+    fn test_consolidate_runs_across_runs() {
+        let runs = vec![
+            vec![
+                create_test_result("Framework A", "file1.pdf", true, 100),
+                create_test_result("Framework B", "file1.pdf", false, 200),
+            ],
+            vec![
+                create_test_result("Framework A", "file1.pdf", true, 120),
+                create_test_result("Framework B", "file1.pdf", true, 180),
+            ],
+        ];
+
+        let consolidated = consolidate_runs(runs).unwrap();
+        assert_eq!(consolidated.run_count, 2);
+        assert_eq!(consolidated.total_files, 4);
+        assert_eq!(consolidated.framework_count, 2);
+        assert_eq!(consolidated.comparison.performance_ranking[0].framework, "Framework A");
+        assert_eq!(
+            consolidated.quality.reliability.perfect_frameworks,
+            vec!["Framework A".to_string()]
+        );
+        assert_eq!(consolidated.quality.reliability.consensus_success_rate, 0.0);
+    }
+
+    #[test]
+    fn test_load_run_results_reads_nested_results() {
+        let temp_dir = tempfile::TempDir::new().unwrap();
+        let nested = temp_dir.path().join("run-1");
+        fs::create_dir_all(&nested).unwrap();
+
+        let results = vec![
+            create_test_result("Framework A", "file1.pdf", true, 100),
+            create_test_result("Framework B", "file1.pdf", true, 200),
+        ];
+        fs::write(nested.join("results.json"), serde_json::to_vec(&results).unwrap()).unwrap();
+
+        let loaded = load_run_results(temp_dir.path()).unwrap();
+        assert_eq!(loaded.len(), 2);
+        assert!(loaded.iter().any(|r| r.framework == "Framework B"));
+    }
 }
@@ -436,13 +436,9 @@ async fn main() -> Result<()> {
                 let _ = key; // used as map key
             }
 
-            std::fs::create_dir_all(&output).map_err(benchmark_harness::Error::Io)?;
-
             // Single unified output file
             let output_file = output.join("aggregated.json");
-            let json = serde_json::to_string_pretty(&aggregated)
-                .map_err(|e| benchmark_harness::Error::Benchmark(format!("Failed to serialize results: {}", e)))?;
-            std::fs::write(&output_file, json).map_err(benchmark_harness::Error::Io)?;
+            benchmark_harness::output::write_pretty_json(&aggregated, &output_file, "results")?;
             println!("\nResults written to: {}", output_file.display());
 
             Ok(())
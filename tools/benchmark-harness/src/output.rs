@@ -3,12 +3,13 @@
 //! This module provides functionality for persisting benchmark results to disk
 //! in JSON format.
 
-use crate::stats::percentile_r7;
+use crate::stats::{percentile_r7, push_finite, sort_samples};
 use crate::types::BenchmarkResult;
 use crate::{Error, Result};
 use serde::{Deserialize, Serialize};
 use std::collections::HashMap;
 use std::fs;
+use std::io::{BufWriter, Write};
 use std::path::Path;
 use std::time::Duration;
 
@@ -61,14 +62,60 @@ pub fn write_json(results: &[BenchmarkResult], output_path: &Path) -> Result<()>
         validate_result(result)?;
     }
 
+    write_compact_json(results, output_path, "results")
+}
+
+/// Write a value to a pretty-printed JSON file
+///
+/// Creates missing parent directories and streams the serialized output through
+/// a buffered writer, so the document is never materialized as a `String` first.
+///
+/// # Arguments
+/// * `value` - Value to serialize
+/// * `output_path` - Path to output JSON file
+/// * `description` - What is being written, used in serialization error messages
+pub fn write_pretty_json<T: Serialize + ?Sized>(value: &T, output_path: &Path, description: &str) -> Result<()> {
+    write_json_to_file(value, output_path, description, true)
+}
+
+/// Write a value to a compact JSON file
+///
+/// Used for raw per-file results, which are only read back by tooling and are
+/// roughly half the size without indentation.
+///
+/// # Arguments
+/// * `value` - Value to serialize
+/// * `output_path` - Path to output JSON file
+/// * `description` - What is being written, used in serialization error messages
+pub fn write_compact_json<T: Serialize + ?Sized>(value: &T, output_path: &Path, description: &str) -> Result<()> {
+    write_json_to_file(value, output_path, description, false)
+}
+
+fn write_json_to_file<T: Serialize + ?Sized>(
+    value: &T,
+    output_path: &Path,
+    description: &str,
+    pretty: bool,
+) -> Result<()> {
     if let Some(parent) = output_path.parent() {
         fs::create_dir_all(parent).map_err(Error::Io)?;
     }
 
-    let json = serde_json::to_string_pretty(results)
-        .map_err(|e| Error::Benchmark(format!("Failed to serialize results: {}", e)))?;
-
-    fs::write(output_path, json).map_err(Error::Io)?;
+    let file = fs::File::create(output_path).map_err(Error::Io)?;
+    let mut writer = BufWriter::new(file);
+    let written = if pretty {
+        serde_json::to_writer_pretty(&mut writer, value)
+    } else {
+        serde_json::to_writer(&mut writer, value)
+    };
+    written.map_err(|e| {
+        if e.is_io() {
+            Error::Io(e.into())
+        } else {
+            Error::Benchmark(format!("Failed to serialize {}: {}", description, e))
+        }
+    })?;
+    writer.flush().map_err(Error::Io)?;
 
     Ok(())
 }
@@ -130,16 +177,14 @@ pub struct ByExtensionReport {
 /// # Returns
 /// * ByExtensionReport with statistics grouped by extension and framework
 pub fn analyze_by_extension(results: &[BenchmarkResult]) -> ByExtensionReport {
-    let mut by_extension: HashMap<String, HashMap<String, Vec<&BenchmarkResult>>> = HashMap::new();
+    // Group on borrowed keys; owned strings are only allocated once per group below
+    let mut by_extension: HashMap<&str, HashMap<&str, Vec<&BenchmarkResult>>> = HashMap::new();
 
     for result in results {
-        let ext = result.file_extension.clone();
-        let framework = result.framework.clone();
-
         by_extension
-            .entry(ext)
+            .entry(result.file_extension.as_str())
             .or_default()
-            .entry(framework)
+            .entry(result.framework.as_str())
             .or_default()
             .push(result);
     }
@@ -151,11 +196,11 @@ pub fn analyze_by_extension(results: &[BenchmarkResult]) -> ByExtensionReport {
         let mut framework_stats = HashMap::new();
         for (framework, results) in framework_results {
             let stats = calculate_framework_stats(&results);
-            framework_stats.insert(framework, stats);
+            framework_stats.insert(framework.to_string(), stats);
         }
 
         report.insert(
-            ext,
+            ext.to_string(),
             ExtensionAnalysis {
                 total_files,
                 framework_stats,
@@ -176,23 +221,36 @@ fn calculate_framework_stats(results: &[&BenchmarkResult]) -> FrameworkExtension
         0.0
     };
 
-    let successful_results: Vec<&&BenchmarkResult> = results.iter().filter(|r| r.success).collect();
+    // Derive every per-result metric in a single pass over the successful results
+    let mut durations: Vec<f64> = Vec::with_capacity(successful);
+    let mut extraction_durations: Vec<f64> = Vec::with_capacity(successful);
+    let mut throughput_mbps_sum = 0.0;
+    let mut peak_memory_mb_sum = 0.0;
 
-    let avg_duration_ms = if !successful_results.is_empty() {
-        successful_results
-            .iter()
-            .map(|r| r.duration.as_secs_f64() * 1000.0)
-            .sum::<f64>()
-            / successful_results.len() as f64
+    for result in results.iter().filter(|r| r.success) {
+        durations.push(result.duration.as_secs_f64() * 1000.0);
+
+        // Extraction duration stats (pure extraction time, excludes subprocess overhead)
+        if let Some(extraction_duration) = result.extraction_duration {
+            push_finite(&mut extraction_durations, extraction_duration.as_secs_f64() * 1000.0);
+        }
+
+        throughput_mbps_sum += result.metrics.throughput_bytes_per_sec / 1_000_000.0;
+        peak_memory_mb_sum += result.metrics.peak_memory_bytes as f64 / 1_000_000.0;
+    }
+
+    let (avg_duration_ms, avg_throughput_mbps, avg_peak_memory_mb) = if !durations.is_empty() {
+        let n = durations.len() as f64;
+        (
+            durations.iter().sum::<f64>() / n,
+            throughput_mbps_sum / n,
+            peak_memory_mb_sum / n,
+        )
     } else {
-        0.0
+        (0.0, 0.0, 0.0)
     };
 
-    let mut durations: Vec<f64> = successful_results
-        .iter()
-        .map(|r| r.duration.as_secs_f64() * 1000.0)
-        .collect();
-    durations.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    sort_samples(&mut durations);
 
     let median_duration_ms = if !durations.is_empty() {
         percentile_r7(&durations, 0.50)
@@ -206,13 +264,7 @@ fn calculate_framework_stats(results: &[&BenchmarkResult]) -> FrameworkExtension
         0.0
     };
 
-    // Extraction duration stats (pure extraction time, excludes subprocess overhead)
-    let mut extraction_durations: Vec<f64> = successful_results
-        .iter()
-        .filter_map(|r| r.extraction_duration.map(|d| d.as_secs_f64() * 1000.0))
-        .filter(|v| !v.is_nan() && v.is_finite())
-        .collect();
-    extraction_durations.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    sort_samples(&mut extraction_durations);
 
     let avg_extraction_duration_ms = if !extraction_durations.is_empty() {
         Some(extraction_durations.iter().sum::<f64>() / extraction_durations.len() as f64)
@@ -232,26 +284,6 @@ fn calculate_framework_stats(results: &[&BenchmarkResult]) -> FrameworkExtension
         None
     };
 
-    let avg_throughput_mbps = if !successful_results.is_empty() {
-        successful_results
-            .iter()
-            .map(|r| r.metrics.throughput_bytes_per_sec / 1_000_000.0)
-            .sum::<f64>()
-            / successful_results.len() as f64
-    } else {
-        0.0
-    };
-
-    let avg_peak_memory_mb = if !successful_results.is_empty() {
-        successful_results
-            .iter()
-            .map(|r| r.metrics.peak_memory_bytes as f64 / 1_000_000.0)
-            .sum::<f64>()
-            / successful_results.len() as f64
-    } else {
-        0.0
-    };
-
     FrameworkExtensionStats {
         count,
         successful,
@@ -274,17 +306,7 @@ fn calculate_framework_stats(results: &[&BenchmarkResult]) -> FrameworkExtension
 /// * `output_path` - Path to output JSON file (e.g., "by-extension.json")
 pub fn write_by_extension_analysis(results: &[BenchmarkResult], output_path: &Path) -> Result<()> {
     let report = analyze_by_extension(results);
-
-    if let Some(parent) = output_path.parent() {
-        fs::create_dir_all(parent).map_err(Error::Io)?;
-    }
-
-    let json = serde_json::to_string_pretty(&report)
-        .map_err(|e| Error::Benchmark(format!("Failed to serialize extension analysis: {}", e)))?;
-
-    fs::write(output_path, json).map_err(Error::Io)?;
-
-    Ok(())
+    write_pretty_json(&report, output_path, "extension analysis")
 }
 
 #[cfg(test)]
@@ -373,6 +395,10 @@ mod tests {
         let parsed: Vec<BenchmarkResult> = serde_json::from_str(&contents).unwrap();
         assert_eq!(parsed.len(), 1);
         assert_eq!(parsed[0].framework, "test-framework");
+        assert!(
+            !contents.contains('\n'),
+            "raw results should be written as compact JSON"
+        );
     }
 
     #[test]
@@ -539,6 +565,23 @@ mod tests {
         assert!((stats.avg_extraction_duration_ms.unwrap() - 100.0).abs() < 0.1);
     }
 
+    #[test]
+    fn test_framework_stats_averages_ignore_failed_results() {
+        // Test: Duration, throughput and memory averages only cover successful results
+        let result1 = create_benchmark_result("framework1", true, 100, Some(80), 2_000_000.0, 10_000_000);
+        let result2 = create_benchmark_result("framework1", true, 300, Some(250), 4_000_000.0, 30_000_000);
+        let result3 = create_benchmark_result("framework1", false, 5000, Some(4000), 100_000_000.0, 900_000_000);
+        let results = vec![&result1, &result2, &result3];
+
+        let stats = calculate_framework_stats(&results);
+
+        assert!((stats.avg_duration_ms - 200.0).abs() < 1e-9);
+        assert!((stats.median_duration_ms - 200.0).abs() < 1e-9);
+        assert!((stats.avg_throughput_mbps - 3.0).abs() < 1e-9);
+        assert!((stats.avg_peak_memory_mb - 20.0).abs() < 1e-9);
+        assert!((stats.avg_extraction_duration_ms.unwrap() - 165.0).abs() < 1e-9);
+    }
+
     #[test]
     fn test_framework_stats_large_number_extraction_durations() {
         // Test: Many extraction_duration values -> percentiles calculated correctly
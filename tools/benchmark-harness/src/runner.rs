@@ -7,7 +7,7 @@ use crate::adapter::FrameworkAdapter;
 use crate::config::{BenchmarkConfig, BenchmarkMode};
 use crate::fixture::FixtureManager;
 use crate::registry::AdapterRegistry;
-use crate::stats::percentile_r7;
+use crate::stats::{percentile_r7, sort_samples};
 use crate::types::{BenchmarkResult, DiskSizeInfo, DurationStatistics, IterationResult, PerformanceMetrics};
 use crate::{Error, Result};
 use std::collections::HashMap;
@@ -73,7 +73,7 @@ fn calculate_statistics(iterations: &[IterationResult]) -> DurationStatistics {
     let mean = Duration::from_secs_f64(mean_ms / 1000.0);
 
     let mut durations_ms: Vec<f64> = durations.iter().map(|d| d.as_secs_f64() * 1000.0).collect();
-    durations_ms.sort_by(|a, b| a.partial_cmp(b).unwrap_or(std::cmp::Ordering::Equal));
+    sort_samples(&mut durations_ms);
     let median = Duration::from_secs_f64(percentile_r7(&durations_ms, 0.50) / 1000.0);
 
     let variance: f64 = if durations.len() > 1 {
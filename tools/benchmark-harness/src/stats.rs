@@ -43,6 +43,24 @@ pub(crate) fn percentile_r7(sorted_values: &[f64], p: f64) -> f64 {
     }
 }
 
+/// Push a sample, dropping NaN and infinite values
+#[inline]
+pub(crate) fn push_finite(samples: &mut Vec<f64>, value: f64) {
+    if value.is_finite() {
+        samples.push(value);
+    }
+}
+
+/// Sort finite samples ascending for percentile lookup
+///
+/// Samples must be finite (e.g. collected with [`push_finite`]). For finite values
+/// `total_cmp` gives the same order as `partial_cmp` up to the sign of zero, and
+/// allows an in-place unstable sort.
+#[inline]
+pub(crate) fn sort_samples(samples: &mut [f64]) {
+    samples.sort_unstable_by(f64::total_cmp);
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
@@ -304,4 +322,23 @@ mod tests {
         // result = 1 * 0.996 + 2 * 0.004 = 0.996 + 0.008 = 1.004
         assert!((p001 - 1.004).abs() < 0.0001);
     }
+
+    // Test 15: push_finite drops NaN and infinite samples
+    #[test]
+    fn test_push_finite_drops_non_finite() {
+        let mut samples = Vec::new();
+        for value in [1.0, f64::NAN, f64::INFINITY, -2.5, f64::NEG_INFINITY] {
+            push_finite(&mut samples, value);
+        }
+        assert_eq!(samples, vec![1.0, -2.5]);
+    }
+
+    // Test 16: sort_samples sorts ascending for percentile lookup
+    #[test]
+    fn test_sort_samples_ascending() {
+        let mut samples = vec![9.0, 1.0, 7.0, 3.0, 2.0];
+        sort_samples(&mut samples);
+        assert_eq!(samples, vec![1.0, 2.0, 3.0, 7.0, 9.0]);
+        assert_eq!(percentile_r7(&samples, 0.50), 3.0);
+    }
 }